@@ -77,6 +77,8 @@ class Channel(metaclass=ABCMeta):
     for the ``prefix`` class attribute.
     """
 
+    __slots__ = ("_index", "_hash", "_name")
+
     prefix: str | None = None
     """A shorthand string prefix for characterizing the channel type."""
 
@@ -98,6 +100,8 @@ class Channel(metaclass=ABCMeta):
         """
         self._validate_index(index)
         self._index = index
+        self._hash = hash((type(self), index))
+        self._name = f"{self.prefix}{index}"
 
     @property
     def index(self) -> int | ParameterExpression:
@@ -114,6 +118,11 @@ class Channel(metaclass=ABCMeta):
         Raises:
             PulseError: If ``index`` is not a nonnegative integer.
         """
+        # Channels are almost always indexed by a plain non-negative int, so accept it directly.
+        # bool and NumPy integers do not match the exact type and get the checks below.
+        if type(index) is int and index >= 0:  # pylint: disable=unidiomatic-typecheck
+            return
+
         if isinstance(index, ParameterExpression) and index.parameters:
             # Parameters are unbound
             return
@@ -139,7 +148,7 @@ class Channel(metaclass=ABCMeta):
     @property
     def name(self) -> str:
         """Return the shorthand alias for this channel, which is based on its type and index."""
-        return f"{self.__class__.prefix}{self._index}"
+        return self._name
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self._index})"
@@ -154,35 +163,56 @@ class Channel(metaclass=ABCMeta):
         Returns:
             True iff equal.
         """
+        if self is other:
+            return True
         if not isinstance(other, Channel):
             return NotImplemented
         return type(self) is type(other) and self._index == other._index
 
     def __hash__(self):
-        return hash((type(self), self._index))
+        return self._hash
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            # Default state of an object with __slots__: (__dict__ or None, slot values).
+            dict_state, slots_state = state
+        else:
+            # Channels pickled before Channel defined __slots__ only have __dict__ state.
+            dict_state, slots_state = state, None
+        for attrs in (dict_state, slots_state):
+            if attrs:
+                for key, value in attrs.items():
+                    setattr(self, key, value)
+        # The hash of a type is only stable within a process, so recompute it on unpickling.
+        self._hash = hash((type(self), self._index))
+        self._name = f"{self.prefix}{self._index}"
 
 
 class PulseChannel(Channel, metaclass=ABCMeta):
     """Base class of transmit Channels. Pulses can be played on these channels."""
 
-    pass
+    __slots__ = ()
 
 
 class ClassicalIOChannel(Channel, metaclass=ABCMeta):
     """Base class of classical IO channels. These cannot have instructions scheduled on them."""
 
-    pass
+    __slots__ = ()
 
 
 class DriveChannel(PulseChannel):
     """Drive channels transmit signals to qubits which enact gate operations."""
 
+    __slots__ = ()
+
     prefix = "d"
 
 
 class MeasureChannel(PulseChannel):
     """Measure channels transmit measurement stimulus pulses for readout."""
 
+    __slots__ = ()
+
     prefix = "m"
 
 
@@ -192,18 +222,24 @@ class ControlChannel(PulseChannel):
     to a particular qubit index.
     """
 
+    __slots__ = ()
+
     prefix = "u"
 
 
 class AcquireChannel(Channel):
     """Acquire channels are used to collect data."""
 
+    __slots__ = ()
+
     prefix = "a"
 
 
 class SnapshotChannel(ClassicalIOChannel):
     """Snapshot channels are used to specify instructions for simulators."""
 
+    __slots__ = ()
+
     prefix = "s"
 
     def __init__(self):
@@ -214,6 +250,8 @@ class SnapshotChannel(ClassicalIOChannel):
 class MemorySlot(ClassicalIOChannel):
     """Memory slot channels represent classical memory storage."""
 
+    __slots__ = ()
+
     prefix = "m"
 
 
@@ -222,4 +260,6 @@ class RegisterSlot(ClassicalIOChannel):
     memory).
     """
 
+    __slots__ = ()
+
     prefix = "c"
@@ -226,7 +226,7 @@ def with_instruction_types(types: Iterable[abc.ABCMeta] | abc.ABCMeta) -> Callab
     Returns:
         A callback function to filter instructions.
     """
-    types = _if_scalar_cast_to_list(types)
+    types = tuple(_if_scalar_cast_to_list(types))
 
     @singledispatch
     def instruction_filter(time_inst) -> bool:
@@ -247,7 +247,7 @@ def with_instruction_types(types: Iterable[abc.ABCMeta] | abc.ABCMeta) -> Callab
         Returns:
             If instruction matches with condition.
         """
-        return isinstance(time_inst[1], tuple(types))
+        return isinstance(time_inst[1], types)
 
     @instruction_filter.register
     def handle_instruction(inst: Instruction) -> bool:
@@ -259,7 +259,7 @@ def with_instruction_types(types: Iterable[abc.ABCMeta] | abc.ABCMeta) -> Callab
         Returns:
             If instruction matches with condition.
         """
-        return isinstance(inst, tuple(types))
+        return isinstance(inst, types)
 
     return instruction_filter
 
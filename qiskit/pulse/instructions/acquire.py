@@ -38,6 +38,8 @@ class Acquire(Instruction):
      * the discriminator to classify kerneled IQ points.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         duration: int | ParameterExpression,
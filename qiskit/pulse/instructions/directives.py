@@ -26,6 +26,8 @@ class Directive(instruction.Instruction, ABC):
     This is a hint to the pulse compiler and is not loaded into hardware.
     """
 
+    __slots__ = ()
+
     @property
     def duration(self) -> int:
         """Duration of this instruction."""
@@ -35,6 +37,8 @@ class Directive(instruction.Instruction, ABC):
 class RelativeBarrier(Directive):
     """Pulse ``RelativeBarrier`` directive."""
 
+    __slots__ = ()
+
     def __init__(self, *channels: chans.Channel, name: str | None = None):
         """Create a relative barrier directive.
 
@@ -102,6 +106,8 @@ class TimeBlockade(Directive):
         user can insert another instruction without timing overlap.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         duration: int,
@@ -38,6 +38,8 @@ class Instruction(ABC):
     channels.
     """
 
+    __slots__ = ("_operands", "_name")
+
     def __init__(
         self,
         operands: tuple,
@@ -132,7 +134,8 @@ class Instruction(ABC):
         Args:
             *channels: Supplied channels
         """
-        if any(chan in self.channels for chan in channels):
+        inst_channels = self.channels
+        if any(chan in inst_channels for chan in channels):
             return self.duration
         return 0
 
@@ -232,6 +235,21 @@ class Instruction(ABC):
     def __hash__(self) -> int:
         return hash((type(self), self.operands, self.name))
 
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            # Default state of an object with __slots__: (__dict__ or None, slot values).
+            dict_state, slots_state = state
+        else:
+            # Instructions pickled before Instruction defined __slots__ only have __dict__ state.
+            dict_state, slots_state = state, None
+        for attrs in (dict_state, slots_state):
+            if attrs:
+                for key, value in attrs.items():
+                    if key == "_hash":
+                        # Unused attribute set on instructions loaded by older QPY readers.
+                        continue
+                    setattr(self, key, value)
+
     def __add__(self, other):
         """Return a new schedule with `other` inserted within `self` at `start_time`.
 
@@ -40,6 +40,8 @@ class ShiftPhase(Instruction):
     by using a ShiftPhase to update the frame tracking the qubit state.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         phase: Union[complex, ParameterExpression],
@@ -101,6 +103,8 @@ class SetPhase(Instruction):
     The ``SetPhase`` instruction sets :math:`\phi` to the instruction's ``phase`` operand.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         phase: Union[complex, ParameterExpression],
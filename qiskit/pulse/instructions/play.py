@@ -32,6 +32,8 @@ class Play(Instruction):
     cycle time, dt, of the backend.
     """
 
+    __slots__ = ()
+
     def __init__(self, pulse: Pulse, channel: PulseChannel, name: str | None = None):
         """Create a new pulse instruction.
 
@@ -34,6 +34,8 @@ class Reference(instruction.Instruction):
     that is supplied at a later time.
     """
 
+    __slots__ = ()
+
     # Delimiter for representing nested scope.
     scope_delimiter = "::"
 
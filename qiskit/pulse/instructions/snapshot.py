@@ -23,6 +23,8 @@ from qiskit.pulse.instructions.instruction import Instruction
 class Snapshot(Instruction):
     """An instruction targeted for simulators, to capture a moment in the simulation."""
 
+    __slots__ = ("_channel",)
+
     def __init__(self, label: str, snapshot_type: str = "statevector", name: Optional[str] = None):
         """Create new snapshot.
 
@@ -123,9 +123,12 @@ def _measure_v1(
     measure_groups = set()
     for qubit in qubits:
         measure_groups.add(tuple(meas_map[qubit]))
+    # Lookup tables shared by all instructions of all measure groups.
+    measured_qubits = set(qubits)
+    used_mem_slots = set(qubit_mem_slots.values()) if qubit_mem_slots is not None else set()
     for measure_group_qubits in measure_groups:
         if qubit_mem_slots is not None:
-            unused_mem_slots = set(measure_group_qubits) - set(qubit_mem_slots.values())
+            unused_mem_slots = set(measure_group_qubits) - used_mem_slots
         try:
             default_sched = inst_map.get(measure_name, measure_group_qubits)
         except exceptions.PulseError as ex:
@@ -136,16 +139,17 @@ def _measure_v1(
                 "{}".format(measure_name, inst_map.instructions)
             ) from ex
         for time, inst in default_sched.instructions:
-            if inst.channel.index not in qubits:
+            qubit_index = inst.channel.index
+            if qubit_index not in measured_qubits:
                 continue
             if qubit_mem_slots and isinstance(inst, instructions.Acquire):
-                if inst.channel.index in qubit_mem_slots:
-                    mem_slot = channels.MemorySlot(qubit_mem_slots[inst.channel.index])
+                if qubit_index in qubit_mem_slots:
+                    mem_slot = channels.MemorySlot(qubit_mem_slots[qubit_index])
                 else:
                     mem_slot = channels.MemorySlot(unused_mem_slots.pop())
                 inst = instructions.Acquire(inst.duration, inst.channel, mem_slot=mem_slot)
             # Measurement pulses should only be added if its qubit was measured by the user
-            schedule = schedule.insert(time, inst)
+            schedule.insert(time, inst, inplace=True)
 
     return schedule
 
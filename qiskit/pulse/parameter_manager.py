@@ -87,21 +87,35 @@ class NodeVisitor:
     outside of the Qiskit Pulse module.
     """
 
+    # Resolved visitor method name for each (visitor class, node class) pair.
+    # Programs visit many nodes of few types, so the superclass walk is done once per type.
+    _visitor_names: dict[tuple[type, type], str] = {}
+
     def visit(self, node: Any):
         """Visit a node."""
         visitor = self._get_visitor(type(node))
         return visitor(node)
 
     def _get_visitor(self, node_class):
+        """A helper function to find the visitor method of the node class."""
+        key = (type(self), node_class)
+        try:
+            name = NodeVisitor._visitor_names[key]
+        except KeyError:
+            name = self._find_visitor_name(node_class)
+            NodeVisitor._visitor_names[key] = name
+        return getattr(self, name)
+
+    def _find_visitor_name(self, node_class) -> str:
         """A helper function to recursively investigate superclass visitor method."""
         if node_class == object:
-            return self.generic_visit
+            return "generic_visit"
 
-        try:
-            return getattr(self, f"visit_{node_class.__name__}")
-        except AttributeError:
-            # check super class
-            return self._get_visitor(node_class.__base__)
+        name = f"visit_{node_class.__name__}"
+        if hasattr(self, name):
+            return name
+        # check super class
+        return self._find_visitor_name(node_class.__base__)
 
     def visit_ScheduleBlock(self, node: ScheduleBlock):
         """Visit ``ScheduleBlock``. Recursively visit context blocks and overwrite.
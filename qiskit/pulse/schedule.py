@@ -36,6 +36,7 @@ import copy
 import functools
 import itertools
 import multiprocessing as mp
+import operator
 import sys
 import warnings
 from collections.abc import Callable, Iterable
@@ -288,12 +289,9 @@ class Schedule:
         Args:
             *channels: Channels within ``self`` to include.
         """
-        try:
-            chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
-            return min(intervals[0][0] for intervals in chan_intervals)
-        except ValueError:
-            # If there are no instructions over channels
-            return 0
+        chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
+        # If there are no instructions over channels, the start time is 0
+        return min((intervals[0][0] for intervals in chan_intervals), default=0)
 
     def ch_stop_time(self, *channels: Channel) -> int:
         """Return maximum start time over supplied channels.
@@ -301,12 +299,9 @@ class Schedule:
         Args:
             *channels: Channels within ``self`` to include.
         """
-        try:
-            chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
-            return max(intervals[-1][1] for intervals in chan_intervals)
-        except ValueError:
-            # If there are no instructions over channels
-            return 0
+        chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
+        # If there are no instructions over channels, the stop time is 0
+        return max((intervals[-1][1] for intervals in chan_intervals), default=0)
 
     def _instructions(self, time: int = 0):
         """Iterable for flattening Schedule tree.
@@ -319,8 +314,17 @@ class Schedule:
                 :class:`~qiskit.pulse.Instruction`
                 starts at and the flattened :class:`~qiskit.pulse.Instruction` s.
         """
-        for insert_time, child_sched in self.children:
-            yield from child_sched._instructions(time + insert_time)
+        # Walk nested schedules with an explicit stack to avoid one generator per nesting level
+        stack = [(time, iter(self._children))]
+        while stack:
+            offset, children = stack[-1]
+            for insert_time, child_sched in children:
+                if isinstance(child_sched, Schedule):
+                    stack.append((offset + insert_time, iter(child_sched._children)))
+                    break
+                yield from child_sched._instructions(offset + insert_time)
+            else:
+                stack.pop()
 
     def shift(self, time: int, name: str | None = None, inplace: bool = False) -> "Schedule":
         """Return a schedule shifted forward by ``time``.
@@ -363,11 +367,13 @@ class Schedule:
         for chan, ch_timeslots in self._timeslots.items():
             timeslots[chan] = [(ts[0] + time, ts[1] + time) for ts in ch_timeslots]
 
-        _check_nonnegative_timeslot(timeslots)
+        if time < 0:
+            # Existing timeslots are nonnegative, so only a negative shift can invalidate them
+            _check_nonnegative_timeslot(timeslots)
 
         self._duration = self._duration + time
         self._timeslots = timeslots
-        self._children = [(orig_time + time, child) for orig_time, child in self.children]
+        self._children = [(orig_time + time, child) for orig_time, child in self._children]
         return self
 
     def insert(
@@ -564,7 +570,8 @@ class Schedule:
                         )
                     ) from ex
 
-        _check_nonnegative_timeslot(self._timeslots)
+        # Timeslots of other channels were already validated when they were added.
+        _check_nonnegative_timeslot({chan: self._timeslots[chan] for chan in schedule.channels})
 
     def _remove_timeslots(self, time: int, schedule: "ScheduleComponent"):
         """Delete the timeslots if present for the respective schedule component.
@@ -579,13 +586,14 @@ class Schedule:
         if not isinstance(time, int):
             raise PulseError("Schedule start time must be an integer.")
 
+        other_timeslots = _get_timeslots(schedule)
+
         for channel in schedule.channels:
 
             if channel not in self._timeslots:
                 raise PulseError(f"The channel {channel} is not present in the schedule")
 
             channel_timeslots = self._timeslots[channel]
-            other_timeslots = _get_timeslots(schedule)
 
             for interval in other_timeslots[channel]:
                 if channel_timeslots:
@@ -745,7 +753,8 @@ class Schedule:
 
     def __len__(self) -> int:
         """Return number of instructions in the schedule."""
-        return len(self.instructions)
+        # Count the flattened instructions without building the time-ordered tuple.
+        return sum(1 for _ in self._instructions())
 
     def __add__(self, other: "ScheduleComponent") -> "Schedule":
         """Return a new schedule with ``other`` inserted within ``self`` at ``start_time``."""
@@ -783,20 +792,25 @@ class Schedule:
         if set(self.channels) != set(other.channels):
             return False
 
+        # Both checks below use the time-ordered instructions, which are sorted on every access.
+        self_instructions = self.instructions
+        other_instructions = other.instructions
+
         # 2. size check
-        if len(self.instructions) != len(other.instructions):
+        if len(self_instructions) != len(other_instructions):
             return False
 
         # 3. instruction check
         return all(
             self_inst == other_inst
-            for self_inst, other_inst in zip(self.instructions, other.instructions)
+            for self_inst, other_inst in zip(self_instructions, other_instructions)
         )
 
     def __repr__(self) -> str:
         name = format(self._name) if self._name else ""
-        instructions = ", ".join([repr(instr) for instr in self.instructions[:50]])
-        if len(self.instructions) > 25:
+        all_instructions = self.instructions
+        instructions = ", ".join([repr(instr) for instr in all_instructions[:50]])
+        if len(all_instructions) > 25:
             instructions += ", ..."
         return f'{self.__class__.__name__}({instructions}, name="{name}")'
 
@@ -1055,10 +1069,7 @@ class ScheduleBlock:
             else:
                 metadata = None
 
-            try:
-                alignment_context = other_program.alignment_context
-            except AttributeError:
-                alignment_context = None
+            alignment_context = getattr(other_program, "alignment_context", None)
 
             return cls(name=name, metadata=metadata, alignment_context=alignment_context)
         except AttributeError as ex:
@@ -1133,7 +1144,7 @@ class ScheduleBlock:
                     f"This schedule contains unassigned reference {elm.ref_keys} "
                     "and channels are ambiguous. Please assign the subroutine first."
                 )
-            chans = chans | set(elm.channels)
+            chans.update(elm.channels)
         return tuple(chans)
 
     @property
@@ -1155,10 +1166,14 @@ class ScheduleBlock:
             the actual timing of when the instructions are issued is unknown until
             the :class:`.ScheduleBlock` is scheduled and converted into a :class:`.Schedule`.
         """
+        # Resolve the reference manager once; from a nested block it walks up to the root.
+        references = None
         blocks = []
         for elm in self._blocks:
             if isinstance(elm, Reference):
-                elm = self.references.get(elm.ref_keys, None) or elm
+                if references is None:
+                    references = self.references
+                elm = references.get(elm.ref_keys, None) or elm
             blocks.append(elm)
         return tuple(blocks)
 
@@ -1557,7 +1572,7 @@ class ScheduleBlock:
 
     def __len__(self) -> int:
         """Return number of instructions in the schedule."""
-        return len(self.blocks)
+        return len(self._blocks)
 
     def __eq__(self, other: object) -> bool:
         """Test if two ScheduleBlocks are equal.
@@ -1591,17 +1606,25 @@ class ScheduleBlock:
             return False
 
         # 3. instruction check with alignment
+        if self.alignment_context.is_sequential:
+            # The DAG of a sequential context is a chain in the order of the blocks,
+            # thus isomorphism reduces to comparing the blocks pairwise.
+            return all(
+                self_blk == other_blk for self_blk, other_blk in zip(self.blocks, other.blocks)
+            )
+
         from qiskit.pulse.transforms.dag import block_to_dag as dag
 
-        if not rx.is_isomorphic_node_match(dag(self), dag(other), lambda x, y: x == y):
+        if not rx.is_isomorphic_node_match(dag(self), dag(other), operator.eq):
             return False
 
         return True
 
     def __repr__(self) -> str:
         name = format(self._name) if self._name else ""
-        blocks = ", ".join([repr(instr) for instr in self.blocks[:50]])
-        if len(self.blocks) > 25:
+        all_blocks = self.blocks
+        blocks = ", ".join([repr(instr) for instr in all_blocks[:50]])
+        if len(all_blocks) > 25:
             blocks += ", ..."
         return '{}({}, name="{}", transform={})'.format(
             self.__class__.__name__, blocks, name, repr(self.alignment_context)
@@ -1726,27 +1749,28 @@ def _interval_index(intervals: list[Interval], interval: Interval) -> int:
     return index
 
 
-def _locate_interval_index(intervals: list[Interval], interval: Interval, index: int = 0) -> int:
+def _locate_interval_index(intervals: list[Interval], interval: Interval) -> int:
     """Using binary search on start times, find an interval.
 
     Args:
         intervals: A sorted list of non-overlapping Intervals.
         interval: The interval for which the index into intervals will be found.
-        index: A running tally of the index, for recursion. The user should not pass a value.
 
     Returns:
         The index into intervals that new_interval would be inserted to maintain
         a sorted list of intervals.
     """
-    if not intervals or len(intervals) == 1:
-        return index
-
-    mid_idx = len(intervals) // 2
-    mid = intervals[mid_idx]
-    if interval[1] <= mid[0] and (interval != mid):
-        return _locate_interval_index(intervals[:mid_idx], interval, index=index)
-    else:
-        return _locate_interval_index(intervals[mid_idx:], interval, index=index + mid_idx)
+    # Narrow the search window in place rather than recursing on list slices,
+    # which would copy half of the remaining intervals at every step.
+    low, high = 0, len(intervals)
+    while high - low > 1:
+        mid_idx = (low + high) // 2
+        mid = intervals[mid_idx]
+        if interval[1] <= mid[0] and (interval != mid):
+            high = mid_idx
+        else:
+            low = mid_idx
+    return low
 
 
 def _find_insertion_index(intervals: list[Interval], new_interval: Interval) -> int:
@@ -1824,11 +1848,13 @@ def _get_references(block_elms: list["BlockComponent"]) -> set[Reference]:
         A set of unique reference instructions.
     """
     references = set()
-    for elm in block_elms:
-        if isinstance(elm, ScheduleBlock):
-            references |= _get_references(elm._blocks)
-        elif isinstance(elm, Reference):
-            references.add(elm)
+    stack = [block_elms]
+    while stack:
+        for elm in stack.pop():
+            if isinstance(elm, ScheduleBlock):
+                stack.append(elm._blocks)
+            elif isinstance(elm, Reference):
+                references.add(elm)
     return references
 
 
@@ -14,8 +14,6 @@ from __future__ import annotations
 import abc
 from typing import Callable, Tuple
 
-import numpy as np
-
 from qiskit.circuit.parameterexpression import ParameterExpression, ParameterValueType
 from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.schedule import Schedule, ScheduleComponent
@@ -140,7 +138,7 @@ class AlignLeft(AlignmentKind):
         ]
 
         if ch_slacks:
-            slack_chan = shared_channels[np.argmin(ch_slacks)]
+            slack_chan = shared_channels[ch_slacks.index(min(ch_slacks))]
             shared_insert_time = this.ch_stop_time(slack_chan) - other.ch_start_time(slack_chan)
         else:
             shared_insert_time = 0
@@ -307,13 +305,13 @@ class AlignEquispaced(AlignmentKind):
             # Calculate the interval in between sub-schedules.
             # If the duration cannot be divided by the number of sub-schedules,
             # the modulo is appended and prepended to the input schedule.
-            interval, mod = np.divmod(total_delay, len(schedule.children) - 1)
+            interval, mod = divmod(total_delay, len(schedule.children) - 1)
         else:
             interval = 0
             mod = total_delay
 
         # Calculate pre schedule delay
-        delay, mod = np.divmod(mod, 2)
+        delay, mod = divmod(mod, 2)
 
         aligned = Schedule.initialize_from(schedule)
         # Insert sub-schedules with interval
@@ -13,7 +13,6 @@
 from __future__ import annotations
 import typing
 import warnings
-from collections import defaultdict
 from collections.abc import Iterable
 from typing import Type
 
@@ -304,7 +303,7 @@ def align_measures(
         acquire_times = []
         for schedule in schedules:
             visited_channels = set()
-            qubit_first_acquire_times: dict[int, int] = defaultdict(lambda: None)
+            qubit_first_acquire_times: dict[int, int] = {}
 
             for time, inst in schedule.instructions:
                 if isinstance(inst, instructions.Acquire) and inst.channel not in visited_channels:
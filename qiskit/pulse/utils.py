@@ -95,6 +95,11 @@ def instruction_duration_validation(duration: int):
         UnassignedDurationError: When duration is unassigned.
         QiskitError: When invalid duration is assigned.
     """
+    # A plain non-negative int is always a valid duration. Other integer-like types, including
+    # bool and NumPy integers, fall through to the full validation.
+    if type(duration) is int and duration >= 0:  # pylint: disable=unidiomatic-typecheck
+        return
+
     if isinstance(duration, ParameterExpression):
         raise UnassignedDurationError(
             "Instruction duration {} is not assigned. "
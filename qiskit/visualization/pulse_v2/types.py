@@ -203,6 +203,8 @@ class DynamicString(str, Enum):
 class WaveformChannel(pulse.channels.PulseChannel):
     """Dummy channel that doesn't belong to specific pulse channel."""
 
+    __slots__ = ()
+
     prefix = "w"
 
     def __init__(self):
@@ -13,10 +13,15 @@
 # pylint: disable=invalid-name
 
 """Test cases for the pulse schedule block."""
+import operator
 import re
 from typing import List, Any
+
+import rustworkx as rx
+
 from qiskit import pulse, circuit
 from qiskit.pulse import transforms
+from qiskit.pulse.transforms.dag import block_to_dag
 from qiskit.pulse.exceptions import PulseError
 from qiskit.providers.fake_provider import FakeOpenPulse2Q
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -609,6 +614,77 @@ class TestBlockEquality(BaseTestBlock):
 
         self.assertNotEqual(block2_a, block2_b)
 
+    def assertEqualityMatchesDag(self, block1, block2, expected):
+        """Check block equality agrees with the DAG isomorphism check."""
+        dag_equal = rx.is_isomorphic_node_match(
+            block_to_dag(block1), block_to_dag(block2), operator.eq
+        )
+        self.assertEqual(dag_equal, expected)
+        self.assertEqual(block1 == block2, expected)
+        self.assertEqual(block2 == block1, expected)
+
+    def test_sequential_equality_matches_dag(self):
+        """Test equality of sequential and equispaced blocks agrees with the DAG comparison."""
+        for context in (self.sequential_context, self.equispaced_context):
+            with self.subTest(context=context):
+                inner_a = pulse.ScheduleBlock(alignment_context=self.left_context)
+                inner_a += pulse.Play(self.test_waveform0, self.d0)
+                inner_a += pulse.Play(self.test_waveform1, self.d1)
+
+                inner_b = pulse.ScheduleBlock(alignment_context=self.left_context)
+                inner_b += pulse.Play(self.test_waveform1, self.d1)
+                inner_b += pulse.Play(self.test_waveform0, self.d0)
+
+                inner_c = pulse.ScheduleBlock(alignment_context=self.left_context)
+                inner_c += pulse.Play(self.test_waveform0, self.d0)
+                inner_c += pulse.Play(self.test_waveform0, self.d1)
+
+                def _outer(*elms, ctx=context):
+                    block = pulse.ScheduleBlock(alignment_context=ctx)
+                    for elm in elms:
+                        block += elm
+                    return block
+
+                delay = pulse.Delay(10, self.d0)
+
+                # Nested blocks that are equal up to reordering in a left context
+                self.assertEqualityMatchesDag(
+                    _outer(delay, inner_a), _outer(delay, inner_b), expected=True
+                )
+                # Nested blocks with different instructions
+                self.assertEqualityMatchesDag(
+                    _outer(delay, inner_a), _outer(delay, inner_c), expected=False
+                )
+                # Same elements in different order
+                self.assertEqualityMatchesDag(
+                    _outer(delay, inner_a), _outer(inner_a, delay), expected=False
+                )
+
+    def test_sequential_equality_with_references_matches_dag(self):
+        """Test equality of sequential blocks with references agrees with the DAG comparison."""
+        sub_a = pulse.ScheduleBlock()
+        sub_a += pulse.Play(self.test_waveform0, self.d0)
+
+        sub_b = pulse.ScheduleBlock()
+        sub_b += pulse.Play(self.test_waveform1, self.d0)
+
+        def _outer(subroutine=None):
+            with pulse.build() as block:
+                with pulse.align_sequential():
+                    pulse.delay(10, self.d1)
+                    pulse.reference("sub")
+            block = block.blocks[0]
+            if subroutine is not None:
+                block.assign_references({("sub",): subroutine}, inplace=True)
+            return block
+
+        # Unassigned references
+        self.assertEqualityMatchesDag(_outer(), _outer(), expected=True)
+        # Same assigned subroutine
+        self.assertEqualityMatchesDag(_outer(sub_a), _outer(sub_a), expected=True)
+        # Different assigned subroutines
+        self.assertEqualityMatchesDag(_outer(sub_a), _outer(sub_b), expected=False)
+
 
 class TestParametrizedBlockOperation(BaseTestBlock):
     """Test fundamental operation with parametrization."""
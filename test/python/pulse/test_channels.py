@@ -12,8 +12,11 @@
 
 """Test cases for the pulse channel group."""
 
+import copy
+import pickle
 import unittest
 
+from qiskit.circuit import Parameter
 from qiskit.pulse.channels import (
     AcquireChannel,
     Channel,
@@ -30,6 +33,16 @@ from qiskit.pulse.channels import (
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 
+class _LabeledChannel(PulseChannel):
+    """A custom channel subclass which carries an extra instance attribute."""
+
+    prefix = "l"
+
+    def __init__(self, index, label):
+        super().__init__(index)
+        self.label = label
+
+
 class TestChannel(QiskitTestCase):
     """Test base channel."""
 
@@ -38,6 +51,41 @@ class TestChannel(QiskitTestCase):
         with self.assertRaises(NotImplementedError):
             Channel(0)
 
+    def test_copy_and_pickle(self):
+        """Test channels survive pickle and copy with the same name and hash."""
+        channels = [DriveChannel(3), DriveChannel(Parameter("a")), SnapshotChannel()]
+        for channel in channels:
+            for copied in (
+                pickle.loads(pickle.dumps(channel)),
+                copy.copy(channel),
+                copy.deepcopy(channel),
+            ):
+                with self.subTest(channel=channel, copied=copied):
+                    self.assertEqual(copied, channel)
+                    self.assertEqual(hash(copied), hash(channel))
+                    self.assertEqual(copied.name, channel.name)
+
+    def test_copy_and_pickle_subclass_attributes(self):
+        """Test extra attributes of a custom channel subclass survive pickle and copy."""
+        channel = _LabeledChannel(2, label="readout")
+        for copied in (
+            pickle.loads(pickle.dumps(channel)),
+            copy.copy(channel),
+            copy.deepcopy(channel),
+        ):
+            with self.subTest(copied=copied):
+                self.assertEqual(copied, channel)
+                self.assertEqual(copied.label, "readout")
+
+    def test_set_state_without_slots(self):
+        """Test the dict state of channels pickled before Channel defined slots is restored."""
+        channel = DriveChannel.__new__(DriveChannel)
+        channel.__setstate__({"_index": 3})
+
+        self.assertEqual(channel, DriveChannel(3))
+        self.assertEqual(hash(channel), hash(DriveChannel(3)))
+        self.assertEqual(channel.name, "d3")
+
 
 class TestPulseChannel(QiskitTestCase):
     """Test base pulse channel."""
@@ -106,6 +106,17 @@ class TestDelay(QiskitTestCase):
         self.assertEqual(delay.duration, 10)
         self.assertIsInstance(delay.duration, np.integer)
 
+    def test_set_state_without_slots(self):
+        """Test restoring a delay from state pickled before instructions defined ``__slots__``."""
+        delay = instructions.Delay.__new__(instructions.Delay)
+        delay.__setstate__(
+            {"_operands": (10, channels.DriveChannel(0)), "_name": "test_name", "_hash": None}
+        )
+        expected = instructions.Delay(10, channels.DriveChannel(0), name="test_name")
+        self.assertEqual(delay, expected)
+        self.assertEqual(hash(delay), hash(expected))
+        self.assertEqual(delay.name, "test_name")
+
     def test_operator_delay(self):
         """Test Operator(delay)."""
         from qiskit.circuit import QuantumCircuit
@@ -50,6 +50,15 @@ class TestMeasure(QiskitTestCase):
         )
         self.assertEqual(sched.instructions, expected.instructions)
 
+    def test_measure_children_are_flat(self):
+        """Test measure inserts instructions directly as children of the returned schedule."""
+        sched = macros.measure(qubits=[0, 1], backend=self.backend)
+        expected = self.inst_map.get("measure", [0, 1])
+        for _, child in sched.children:
+            self.assertNotIsInstance(child, Schedule)
+        self.assertEqual(len(sched.children), len(expected.instructions))
+        self.assertEqual(sched.instructions, expected.instructions)
+
     def test_measure_sched_with_qubit_mem_slots(self):
         """Test measure with custom qubit_mem_slots."""
         sched = macros.measure(qubits=[0], backend=self.backend, qubit_mem_slots={0: 1})
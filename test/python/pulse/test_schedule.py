@@ -34,6 +34,7 @@ from qiskit.pulse import (
     ShiftFrequency,
     SetPhase,
 )
+from qiskit.pulse import filters
 from qiskit.pulse.channels import (
     MemorySlot,
     RegisterSlot,
@@ -43,6 +44,7 @@ from qiskit.pulse.channels import (
     SnapshotChannel,
     MeasureChannel,
 )
+from qiskit.circuit import Parameter
 from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.schedule import Schedule, _overlaps, _find_insertion_index
 from qiskit.providers.fake_provider import FakeOpenPulse2Q
@@ -628,6 +630,18 @@ class TestScheduleFilter(BaseTestSchedule):
         for _, inst in excluded.instructions:
             self.assertFalse(any(chan in channels for chan in inst.channels))
 
+    def test_filter_channels_bound_parameter_index(self):
+        """Test filtering matches a channel whose index is a bound parameter expression."""
+        param = Parameter("a")
+        bound_index = param.assign(param, 1)
+        sched = Schedule(name="fake_experiment")
+        sched = sched.insert(0, Delay(10, DriveChannel(bound_index)))
+        sched = sched.insert(0, Delay(10, DriveChannel(0)))
+
+        filtered, excluded = self._filter_and_test_consistency(sched, channels=[DriveChannel(1)])
+        self.assertEqual(len(filtered.instructions), 1)
+        self.assertEqual(len(excluded.instructions), 1)
+
     def test_filter_exclude_name(self):
         """Test the name of the schedules after applying filter and exclude functions."""
         sched = Schedule(name="test-schedule")
@@ -702,6 +716,23 @@ class TestScheduleFilter(BaseTestSchedule):
         self.assertEqual(len(only_shiftf.instructions), 1)
         self.assertEqual(len(no_shiftf.instructions), 8)
 
+    def test_filter_inst_types_iterator(self):
+        """Test filtering on instruction types given as a one-shot iterator."""
+        lp0 = self.linear(duration=3, slope=0.2, intercept=0.1)
+        sched = Schedule(name="fake_experiment")
+        sched = sched.insert(0, Play(lp0, self.config.drive(0)))
+        sched = sched.insert(10, Play(lp0, self.config.drive(1)))
+        sched = sched.insert(30, ShiftPhase(-1.57, self.config.drive(0)))
+
+        only_play = sched.filter(instruction_types=(inst_type for inst_type in [Play]))
+        self.assertEqual(len(only_play.instructions), 2)
+
+        # The same filter instance is applied to the schedule twice
+        play_filter = filters.with_instruction_types(iter([Play]))
+        for _ in range(2):
+            filtered = [inst for _, inst in sched.instructions if play_filter(inst)]
+            self.assertEqual(len(filtered), 2)
+
     def test_filter_intervals(self):
         """Test filtering on intervals."""
         lp0 = self.linear(duration=3, slope=0.2, intercept=0.1)